@@ -1,20 +1,22 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox, PhotoImage
 import cantools
-from openpyxl import Workbook, load_workbook
+from openpyxl import load_workbook
 from openpyxl.utils import get_column_letter
-from openpyxl.styles import Alignment, Font, Border, Side, PatternFill
+from xml.sax.saxutils import escape as xml_escape
+import os
+import re
 import sys
-from ctypes import windll
+import pickle
+import hashlib
+import operator
+import zipfile
+import multiprocessing
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import ctypes
 
-# DPI awareness (Windows)
-try:
-    ctypes.windll.shcore.SetProcessDpiAwareness(1)
-except Exception:
-    pass
-
 def get_base_assets_path() -> Path:
     """
     Returns the base path for assets:
@@ -31,78 +33,399 @@ def relative_to_assets(path: str) -> str:
         raise FileNotFoundError(f"Asset file not found: {asset_path}")
     return str(asset_path)
 
+# DBC files are normally read with a small line parser that only extracts the
+# BO_/SG_ fields shown in the CAN Matrix. Set to True to load them through
+# cantools instead (full validation of the file, but much slower).
+USE_CANTOOLS_PARSER = False
+
+# Parsed DBC contents are cached here between runs, for files of at least
+# _DBC_CACHE_MIN_SIZE bytes.
+_DBC_CACHE_DIR = Path.home() / ".cache" / "can_matrix_creator"
+_DBC_CACHE_MIN_SIZE = 100 * 1024
+# Part of every cache key. Bump whenever the DBC readers or the cached tuple
+# layout change, so entries written by older versions are ignored.
+_DBC_CACHE_VERSION = 2
+
+# Signal attributes exported to the CAN Matrix, fetched in one call per signal.
+# Both DBC readers yield signals as tuples in this order.
+_SIGNAL_FIELDS = operator.attrgetter(
+    "name", "start", "length", "is_signed", "scale", "offset",
+    "byte_order", "unit", "minimum", "maximum",
+)
+
+_BO_RE = re.compile(rb"^BO_\s+(\d+)\s+(\w+)\s*:")
+_SG_RE = re.compile(
+    rb'^\s*SG_\s+(\w+)[^:]*:\s*(\d+)\|(\d+)@([01])([-+])\s*'
+    rb'\(([^,]+),([^)]+)\)\s*\[([^|]*)\|([^\]]*)\]\s*"([^"]*)"'
+)
+# Names longer than 32 characters are stored as attributes on the short name.
+_LONG_NAME_RE = re.compile(
+    rb'^BA_\s+"System(?:Message|Signal)LongSymbol"\s+(BO_|SG_)\s+(\d+)\s+(?:(\w+)\s+)?"([^"]*)"'
+)
+
+# Accepted "Byte Ordering" / "Signed/Unsigned" cell values (lower-cased).
+_BYTE_ORDER_MAP = {
+    "motorola": "big_endian",
+    "intel": "little_endian",
+    "big_endian": "big_endian",
+    "little_endian": "little_endian",
+}
+_SIGNED_VALUES = frozenset({"signed", "s"})
+
+# Consecutive empty rows after the data at which reading a CAN Matrix stops.
+_MAX_TRAILING_BLANK_ROWS = 1000
+
+# Fixed DBC header written ahead of the message definitions.
+_DBC_PREAMBLE = (
+    'VERSION ""\n'
+    "\n"
+    "NS_ :\n"
+    "\n"
+    "BS_:\n"
+    "\n"
+    "BU_:\n"
+    "\n"
+)
+
+# BO_/SG_ line templates for the DBC writer.
+_BO_TMPL = "BO_ %d %s: %d Vector__XXX\n"
+_SG_TMPL = ' SG_ %s : %d|%d@%d%s (%s,%s) [%s|%s] "%s" Vector__XXX\n'
+
+# Static parts of the CAN Matrix .xlsx package. Only the worksheet XML varies
+# per file, so everything else is written verbatim.
+_XLSX_SHEET_NAME = "CAN Messages"
+
+_XLSX_CONTENT_TYPES = (
+    b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    b'<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    b'<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    b'<Default Extension="xml" ContentType="application/xml"/>'
+    b'<Override PartName="/xl/workbook.xml" '
+    b'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    b'<Override PartName="/xl/worksheets/sheet1.xml" '
+    b'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    b'<Override PartName="/xl/styles.xml" '
+    b'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    b'</Types>'
+)
+
+_XLSX_ROOT_RELS = (
+    b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    b'<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    b'<Relationship Id="rId1" '
+    b'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    b'Target="xl/workbook.xml"/>'
+    b'</Relationships>'
+)
+
+_XLSX_WORKBOOK_RELS = (
+    b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    b'<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    b'<Relationship Id="rId1" '
+    b'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    b'Target="worksheets/sheet1.xml"/>'
+    b'<Relationship Id="rId2" '
+    b'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+    b'Target="styles.xml"/>'
+    b'</Relationships>'
+)
+
+_XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    f'<sheets><sheet name="{_XLSX_SHEET_NAME}" sheetId="1" r:id="rId1"/></sheets>'
+    '<definedNames><definedName name="_xlnm._FilterDatabase" localSheetId="0" hidden="1">'
+    f"'{_XLSX_SHEET_NAME}'!$A$1:$K$1</definedName></definedNames>"
+    '</workbook>'
+).encode("utf-8")
+
+# Cell formats: 0 = default, 1 = header (bold, light-blue fill, centered, thin
+# border), 2 = data rows using the "can_row" named style (centered, thin border).
+_XLSX_STYLES = (
+    b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    b'<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    b'<fonts count="2">'
+    b'<font><sz val="11"/><name val="Calibri"/><family val="2"/></font>'
+    b'<font><b/><sz val="11"/><name val="Calibri"/><family val="2"/></font>'
+    b'</fonts>'
+    b'<fills count="3">'
+    b'<fill><patternFill patternType="none"/></fill>'
+    b'<fill><patternFill patternType="gray125"/></fill>'
+    b'<fill><patternFill patternType="solid"><fgColor rgb="FFADD8E6"/><bgColor rgb="FFADD8E6"/></patternFill></fill>'
+    b'</fills>'
+    b'<borders count="2">'
+    b'<border><left/><right/><top/><bottom/><diagonal/></border>'
+    b'<border><left style="thin"/><right style="thin"/><top style="thin"/><bottom style="thin"/><diagonal/></border>'
+    b'</borders>'
+    b'<cellStyleXfs count="2">'
+    b'<xf numFmtId="0" fontId="0" fillId="0" borderId="0"/>'
+    b'<xf numFmtId="0" fontId="0" fillId="0" borderId="1" applyBorder="1" applyAlignment="1">'
+    b'<alignment horizontal="center" vertical="center" wrapText="1"/></xf>'
+    b'</cellStyleXfs>'
+    b'<cellXfs count="3">'
+    b'<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    b'<xf numFmtId="0" fontId="1" fillId="2" borderId="1" xfId="0" '
+    b'applyFont="1" applyFill="1" applyBorder="1" applyAlignment="1">'
+    b'<alignment horizontal="center" vertical="center" wrapText="1"/></xf>'
+    b'<xf numFmtId="0" fontId="0" fillId="0" borderId="1" xfId="1" applyBorder="1" applyAlignment="1">'
+    b'<alignment horizontal="center" vertical="center" wrapText="1"/></xf>'
+    b'</cellXfs>'
+    b'<cellStyles count="2">'
+    b'<cellStyle name="Normal" xfId="0" builtinId="0"/>'
+    b'<cellStyle name="can_row" xfId="1"/>'
+    b'</cellStyles>'
+    b'</styleSheet>'
+)
+
+_XLSX_TEMPLATE = (
+    ("[Content_Types].xml", _XLSX_CONTENT_TYPES),
+    ("_rels/.rels", _XLSX_ROOT_RELS),
+    ("xl/workbook.xml", _XLSX_WORKBOOK),
+    ("xl/_rels/workbook.xml.rels", _XLSX_WORKBOOK_RELS),
+    ("xl/styles.xml", _XLSX_STYLES),
+)
+
+# zlib level for the worksheet XML. Level 1 is roughly 2-3x faster than the
+# default level 6 on this kind of repetitive XML, at a modestly larger file.
+_XLSX_COMPRESSLEVEL = 1
+
+_XLSX_SHEET_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+)
+
+def _xlsx_cell(ref: str, value, style: int) -> str:
+    """Render one worksheet cell: numbers as values, everything else as inline strings."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return f'<c r="{ref}" s="{style}"><v>{value!r}</v></c>'
+    return f'<c r="{ref}" s="{style}" t="inlineStr"><is><t>{xml_escape(str(value))}</t></is></c>'
+
+def _write_can_matrix_xlsx(output_file: str, headers: list[str], rows: list[list], col_widths: list[int]) -> None:
+    """
+    Write the CAN Matrix sheet as a minimal .xlsx package.
+    The worksheet XML is generated directly; the remaining parts are static.
+    """
+    letters = [get_column_letter(col) for col in range(1, len(headers) + 1)]
+
+    parts = [_XLSX_SHEET_HEAD, "<cols>"]
+    for col, width in enumerate(col_widths, start=1):
+        parts.append(f'<col min="{col}" max="{col}" width="{width + 2}" customWidth="1"/>')
+    parts.append("</cols><sheetData>")
+
+    parts.append('<row r="1">')
+    parts.extend(_xlsx_cell(f"{letter}1", title, 1) for letter, title in zip(letters, headers))
+    parts.append("</row>")
+
+    for r, row_data in enumerate(rows, start=2):
+        parts.append(f'<row r="{r}">')
+        parts.extend(_xlsx_cell(f"{letter}{r}", value, 2) for letter, value in zip(letters, row_data))
+        parts.append("</row>")
+
+    parts.append(f'</sheetData><autoFilter ref="A1:{letters[-1]}1"/></worksheet>')
+
+    with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED, compresslevel=_XLSX_COMPRESSLEVEL) as archive:
+        # The static parts are a few hundred bytes each; storing them skips
+        # a deflate stream per part for no measurable size difference.
+        for name, data in _XLSX_TEMPLATE:
+            archive.writestr(name, data, compress_type=zipfile.ZIP_STORED)
+        archive.writestr("xl/worksheets/sheet1.xml", "".join(parts))
+
+def _dbc_num(text: bytes) -> int | float:
+    """Convert a DBC number token to int or float, as cantools does."""
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+def _dbc_start_bit(signal: tuple) -> int:
+    """Sort key matching cantools' default signal order (by LSB-relative start bit)."""
+    start = signal[1]
+    if signal[6] == "big_endian":
+        return 8 * (start // 8) + (7 - (start % 8))
+    return start
+
+def _parse_dbc_minimal(file_path: str) -> list[tuple[int, str, list[tuple]]]:
+    """
+    Read only the message and signal definitions from a DBC file.
+    Returns [(frame_id, message_name, [signal tuple, ...]), ...] with signal
+    tuples ordered like _SIGNAL_FIELDS.
+    """
+    messages = []  # [frame_id as written in the DBC, name, signals]
+    signals = None
+    long_names = {}  # (frame_id, short signal name or None) -> long name
+    with open(file_path, "rb") as f:
+        for line in f:
+            bo = _BO_RE.match(line)
+            if bo:
+                name = bo.group(2).decode("cp1252")
+                # cantools discards this pseudo-message holding unassigned signals.
+                if name == "VECTOR__INDEPENDENT_SIG_MSG":
+                    signals = None
+                    continue
+                signals = []
+                messages.append([int(bo.group(1)), name, signals])
+                continue
+
+            if line.startswith(b"BA_ "):
+                long_name = _LONG_NAME_RE.match(line)
+                if long_name:
+                    kind, frame_id, short_name, name = long_name.groups()
+                    short_name = short_name.decode("cp1252") if kind == b"SG_" and short_name else None
+                    long_names[(int(frame_id), short_name)] = name.decode("cp1252")
+                continue
+
+            if signals is None:
+                continue
+            sg = _SG_RE.match(line)
+            if sg:
+                (name, start, length, byte_order, sign, scale, offset,
+                 minimum, maximum, unit) = sg.groups()
+                minimum = minimum.strip()
+                maximum = maximum.strip()
+                if minimum == maximum == b"0":
+                    minimum = maximum = None
+                else:
+                    minimum = _dbc_num(minimum)
+                    maximum = _dbc_num(maximum)
+                signals.append((
+                    name.decode("cp1252"),
+                    int(start),
+                    int(length),
+                    sign == b"-",
+                    _dbc_num(scale.strip()),
+                    _dbc_num(offset.strip()),
+                    "big_endian" if byte_order == b"0" else "little_endian",
+                    unit.decode("cp1252") or None,
+                    minimum,
+                    maximum,
+                ))
+
+    result = []
+    for frame_id, name, sigs in messages:
+        if long_names:
+            name = long_names.get((frame_id, None), name)
+            sigs = [
+                (long_names.get((frame_id, sig[0]), sig[0]),) + sig[1:]
+                for sig in sigs
+            ]
+        sigs.sort(key=_dbc_start_bit)
+        result.append((frame_id & 0x7FFFFFFF, name, sigs))
+    return result
+
+def _cache_path(file_path: str) -> Path | None:
+    """
+    Location of the parse cache entry for a DBC file.
+    The name is "<path hash>-<state hash>.pickle": the first part identifies the
+    resolved path, the second its mtime, size, parser choice and cache version.
+    Returns None for small files, which parse faster than a cache round-trip.
+    """
+    stat = Path(file_path).stat()
+    if stat.st_size < _DBC_CACHE_MIN_SIZE:
+        return None
+    path_key = str(Path(file_path).resolve())
+    state_key = f"{stat.st_mtime_ns}|{stat.st_size}|{USE_CANTOOLS_PARSER}|{_DBC_CACHE_VERSION}"
+    path_hash = hashlib.blake2b(path_key.encode("utf-8"), digest_size=8).hexdigest()
+    state_hash = hashlib.blake2b(state_key.encode("utf-8"), digest_size=8).hexdigest()
+    return _DBC_CACHE_DIR / f"{path_hash}-{state_hash}.pickle"
+
+def _cache_load(file_path: str) -> list[tuple[int, str, list[tuple]]] | None:
+    """Return the cached parse of a DBC file, or None on a miss."""
+    try:
+        cache_file = _cache_path(file_path)
+        if cache_file is None or not cache_file.exists():
+            return None
+        with open(cache_file, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        return None
+
+def _cache_store(file_path: str, data: list[tuple[int, str, list[tuple]]]) -> None:
+    """
+    Save a DBC parse result; failures only cost the cache.
+    Older entries for the same path (previous mtimes or cache versions) are
+    removed, so the cache holds at most one entry per DBC file.
+    """
+    try:
+        cache_file = _cache_path(file_path)
+        if cache_file is None:
+            return
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        path_hash = cache_file.name.split("-", 1)[0]
+        for stale in cache_file.parent.glob(f"{path_hash}-*.pickle"):
+            if stale != cache_file:
+                stale.unlink(missing_ok=True)
+        # Write then rename so a concurrent batch worker never reads a partial file.
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except Exception:
+        pass
+
+def _load_dbc_messages(file_path: str) -> list[tuple[int, str, list[tuple]]]:
+    """Load a CAN database file as [(frame_id, message_name, [signal tuple, ...]), ...]."""
+    cached = _cache_load(file_path)
+    if cached is not None:
+        return cached
+
+    # The line parser only understands DBC syntax; other formats (.sym, .kcd,
+    # .arxml, ...) and DBC files it finds no messages in go through cantools,
+    # which detects the format and raises on files that are not a database.
+    messages = None
+    if not USE_CANTOOLS_PARSER and Path(file_path).suffix.lower() == ".dbc":
+        messages = _parse_dbc_minimal(file_path)
+    if not messages:
+        db = cantools.database.load_file(file_path)
+        messages = [
+            (message.frame_id, message.name, [_SIGNAL_FIELDS(signal) for signal in message.signals])
+            for message in db.messages
+        ]
+    if messages:
+        _cache_store(file_path, messages)
+    return messages
+
 def process_dbc_file(file_path: str, output_file: str, silent: bool = False) -> str | None:
     """
     Convert a DBC file to a CAN Matrix Excel (.xlsx).
     Returns the output file path if success, None otherwise.
     """
     try:
-        db = cantools.database.load_file(file_path)
-
-        workbook = Workbook()
-        sheet = workbook.active
-        sheet.title = "CAN Messages"
+        dbc_messages = _load_dbc_messages(file_path)
 
         headers = [
             "CAN ID & Message Name", "Signal Name", "Byte Ordering", "Signed/Unsigned", "Start Bit", "Length",
             "Factor", "Offset", "Min Value", "Max Value", "Units"
         ]
-        sheet.append(headers)
-
-        header_fill = PatternFill(start_color="ADD8E6", end_color="ADD8E6", fill_type="solid")
-        for col in range(1, len(headers) + 1):
-            header_cell = sheet.cell(row=1, column=col)
-            header_cell.font = Font(bold=True)
-            header_cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-            header_cell.fill = header_fill
 
-        sheet.auto_filter.ref = f"A1:{get_column_letter(len(headers))}1"
-        current_row = 2
-
-        for message in db.messages:
-            can_id = hex(message.frame_id)
-            message_name = message.name
+        rows = []
+        rows_append = rows.append
+        col_widths = [len(h) for h in headers]
+        for frame_id, message_name, signals in dbc_messages:
+            can_id = hex(frame_id)
             message_name_cell = f"{can_id} - {message_name}"
 
-            for signal in message.signals:
-                signal_name = signal.name
-                start_bit = signal.start
-                length = signal.length
-                signed = "Signed" if signal.is_signed else "Unsigned"
-                factor = signal.scale
-                offset = signal.offset
-                byte_ordering = "Motorola" if signal.byte_order == "big_endian" else "Intel"
-                units = signal.unit if signal.unit else "N/A"
-                min_value = signal.minimum if signal.minimum is not None else "N/A"
-                max_value = signal.maximum if signal.maximum is not None else "N/A"
+            for (signal_name, start_bit, length, is_signed, factor, offset,
+                 byte_order, unit, minimum, maximum) in signals:
+                signed = "Signed" if is_signed else "Unsigned"
+                byte_ordering = "Motorola" if byte_order == "big_endian" else "Intel"
+                units = unit if unit else "N/A"
+                min_value = minimum if minimum is not None else "N/A"
+                max_value = maximum if maximum is not None else "N/A"
 
                 row_data = [
                     message_name_cell, signal_name, byte_ordering, signed, start_bit,
                     length, factor, offset, min_value, max_value, units
                 ]
-                for c, data in enumerate(row_data, start=1):
-                    cell = sheet.cell(row=current_row, column=c, value=data)
-                    cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-                current_row += 1
-
-        # Auto-fit columns
-        for col in range(1, len(headers) + 1):
-            column_letter = get_column_letter(col)
-            max_length = 0
-            for row in sheet.iter_rows(min_col=col, max_col=col, min_row=1, max_row=current_row - 1):
-                val = row[0].value
-                if val is not None:
-                    max_length = max(max_length, len(str(val)))
-            sheet.column_dimensions[column_letter].width = max_length + 2
-
-        border_style = Border(left=Side(style="thin"), right=Side(style="thin"),
-                              top=Side(style="thin"), bottom=Side(style="thin"))
-        for row in sheet.iter_rows(min_row=1, max_row=current_row - 1, min_col=1, max_col=len(headers)):
-            for cell in row:
-                cell.border = border_style
+                # Auto-fit columns: track the widest value while building rows
+                for i, val in enumerate(row_data):
+                    val_length = len(str(val))
+                    if val_length > col_widths[i]:
+                        col_widths[i] = val_length
+                rows_append(row_data)
 
         Path(output_file).parent.mkdir(parents=True, exist_ok=True)
-        workbook.save(output_file)
+        _write_can_matrix_xlsx(output_file, headers, rows, col_widths)
 
         if not silent:
             messagebox.showinfo("Success", f"Data written to {output_file}")
@@ -114,114 +437,163 @@ def process_dbc_file(file_path: str, output_file: str, silent: bool = False) ->
             print(f"[ERROR] {file_path} -> {e}")
         return None
 
+def _signal_end_bit(start: int, length: int, byte_order: str) -> int:
+    """
+    One past the last payload bit a signal occupies, counted from bit 0 of byte 0.
+    Motorola start bits name the MSB, so they are mapped to the big-endian bit
+    numbering before adding the length.
+    """
+    if byte_order == "big_endian":
+        return 8 * (start // 8) + (7 - (start % 8)) + length
+    return start + length
+
+def _new_signal_columns() -> dict[str, list]:
+    """Empty per-message signal columns used while reading a CAN Matrix."""
+    return {
+        "name": [], "start": [], "length": [], "byte_order": [], "is_signed": [],
+        "scale": [], "offset": [], "minimum": [], "maximum": [], "unit": [],
+    }
+
 def process_excel_to_dbc(excel_path: str, output_dbc: str, silent: bool = False) -> str | None:
     """
     Convert a CAN Matrix Excel (.xlsx) back to a DBC file.
     Returns the output DBC path if success, None otherwise.
     """
     try:
-        wb = load_workbook(excel_path, data_only=True)
-        sheet = wb.active
-
-        header = [cell.value for cell in next(sheet.iter_rows(min_row=1, max_row=1))]
-        expected = [
-            "CAN ID & Message Name", "Signal Name", "Byte Ordering", "Signed/Unsigned", "Start Bit", "Length",
-            "Factor", "Offset", "Min Value", "Max Value", "Units"
-        ]
-        if header[:len(expected)] != expected:
-            message = "Excel format is not recognized. Expected CAN Matrix header."
-            if not silent:
-                messagebox.showerror("Error", message)
-            else:
-                print(f"[ERROR] {excel_path} -> {message}")
-            return None
-
-        rows = list(sheet.iter_rows(min_row=2, values_only=True))
-        messages = {}  # (frame_id, msg_name) -> list[signal dict]
-
-        for r in rows:
-            if not r or all(v is None for v in r):
-                continue
-
-            can_msg, sig_name, byte_ordering, signed_text, start_bit, length, factor, offset, min_v, max_v, units = r[:11]
-            if not can_msg or not sig_name:
-                continue
-
-            try:
-                id_part, name_part = [p.strip() for p in str(can_msg).split("-", 1)]
-                frame_id = int(id_part, 16)
-                msg_name = name_part
-            except Exception:
-                message = f"Invalid 'CAN ID & Message Name' cell: {can_msg}"
+        # Read-only mode parses the sheet XML lazily instead of building a
+        # Cell object for every cell up front; it must be closed explicitly.
+        wb = load_workbook(excel_path, data_only=True, read_only=True)
+        try:
+            sheet = wb.active
+
+            header = list(next(sheet.iter_rows(min_row=1, max_row=1, values_only=True)))
+            expected = [
+                "CAN ID & Message Name", "Signal Name", "Byte Ordering", "Signed/Unsigned", "Start Bit", "Length",
+                "Factor", "Offset", "Min Value", "Max Value", "Units"
+            ]
+            if header[:len(expected)] != expected:
+                message = "Excel format is not recognized. Expected CAN Matrix header."
                 if not silent:
                     messagebox.showerror("Error", message)
                 else:
                     print(f"[ERROR] {excel_path} -> {message}")
                 return None
 
-            byte_order = "big_endian" if str(byte_ordering).strip().lower().startswith("motorola") else "little_endian"
-            is_signed = str(signed_text).strip().lower().startswith("signed")
-            start = int(start_bit)
-            leng = int(length)
-            scale = float(factor) if factor is not None else 1.0
-            offs = float(offset) if offset is not None else 0.0
-            minimum = float(min_v) if (min_v not in (None, "N/A")) else None
-            maximum = float(max_v) if (max_v not in (None, "N/A")) else None
-            unit = None if (units in (None, "N/A")) else str(units)
-
-            signals = messages.setdefault((frame_id, msg_name), [])
-            signals.append({
-                "name": str(sig_name),
-                "start": start,
-                "length": leng,
-                "byte_order": byte_order,
-                "is_signed": is_signed,
-                "scale": scale,
-                "offset": offs,
-                "minimum": minimum,
-                "maximum": maximum,
-                "unit": unit,
-            })
-
-        db = cantools.database.Database()
-        from cantools.database.can.signal import Signal
-        from cantools.database.can.message import Message
-
-        for (frame_id, msg_name), sigs in messages.items():
-            ct_signals = [
-                Signal(
-                    name=s["name"],
-                    start=s["start"],
-                    length=s["length"],
-                    byte_order=s["byte_order"],
-                    is_signed=s["is_signed"],
-                    scale=s["scale"],
-                    offset=s["offset"],
-                    minimum=s["minimum"],
-                    maximum=s["maximum"],
-                    unit=s["unit"],
+            messages = defaultdict(_new_signal_columns)  # (frame_id, msg_name) -> {field: [value per signal]}
+            message_keys = {}  # raw "CAN ID & Message Name" cell -> (frame_id, msg_name)
+
+            # Rows are streamed; max_col pads short rows so the unpack below holds.
+            seen_data = False
+            blank_run = 0
+            for r in sheet.iter_rows(min_row=2, max_col=11, values_only=True):
+                if not r or all(v is None for v in r):
+                    # Formatting left behind below the matrix makes openpyxl
+                    # parse thousands of empty rows; stop once a long run of
+                    # them follows the data. Short gaps are still skipped.
+                    if seen_data:
+                        blank_run += 1
+                        if blank_run >= _MAX_TRAILING_BLANK_ROWS:
+                            break
+                    continue
+                seen_data = True
+                blank_run = 0
+
+                can_msg, sig_name, byte_ordering, signed_text, start_bit, length, factor, offset, min_v, max_v, units = r[:11]
+                if not can_msg or not sig_name:
+                    continue
+
+                # Every signal row repeats its message cell, so parse each
+                # distinct value once.
+                message_key = message_keys.get(can_msg)
+                if message_key is None:
+                    try:
+                        id_part, name_part = [p.strip() for p in str(can_msg).split("-", 1)]
+                        message_key = message_keys[can_msg] = (int(id_part, 16), name_part)
+                    except Exception:
+                        message = f"Invalid 'CAN ID & Message Name' cell: {can_msg}"
+                        if not silent:
+                            messagebox.showerror("Error", message)
+                        else:
+                            print(f"[ERROR] {excel_path} -> {message}")
+                        return None
+
+                byte_order_key = byte_ordering.strip().lower() if isinstance(byte_ordering, str) else "intel"
+                byte_order = _BYTE_ORDER_MAP.get(byte_order_key, "little_endian")
+                is_signed = isinstance(signed_text, str) and signed_text.strip().lower() in _SIGNED_VALUES
+                # openpyxl already returns numeric cells as int/float; only
+                # convert values that arrive as some other type (e.g. text).
+                start = start_bit if type(start_bit) is int else int(start_bit)
+                leng = length if type(length) is int else int(length)
+                if factor is None:
+                    scale = 1.0
+                else:
+                    scale = factor if type(factor) is float else float(factor)
+                if offset is None:
+                    offs = 0.0
+                else:
+                    offs = offset if type(offset) is float else float(offset)
+                if min_v is None or min_v == "N/A":
+                    minimum = None
+                else:
+                    minimum = min_v if type(min_v) is float else float(min_v)
+                if max_v is None or max_v == "N/A":
+                    maximum = None
+                else:
+                    maximum = max_v if type(max_v) is float else float(max_v)
+                unit = None if (units in (None, "N/A")) else str(units)
+
+                columns = messages[message_key]
+                columns["name"].append(str(sig_name))
+                columns["start"].append(start)
+                columns["length"].append(leng)
+                columns["byte_order"].append(byte_order)
+                columns["is_signed"].append(is_signed)
+                columns["scale"].append(scale)
+                columns["offset"].append(offs)
+                columns["minimum"].append(minimum)
+                columns["maximum"].append(maximum)
+                columns["unit"].append(unit)
+        finally:
+            wb.close()
+
+        # Emit the DBC text directly; building cantools Message/Signal objects
+        # only to serialize them again costs far more than the formatting.
+        lines = [_DBC_PREAMBLE]
+        lines_append = lines.append
+
+        for (frame_id, msg_name), columns in messages.items():
+            end_bits = list(map(_signal_end_bit, columns["start"], columns["length"], columns["byte_order"]))
+            max_end_bit = max(end_bits)
+            if max_end_bit > 64:
+                sig_name = columns["name"][end_bits.index(max_end_bit)]
+                raise ValueError(
+                    f"Signal '{sig_name}' does not fit in message '{msg_name}' "
+                    f"(needs {(max_end_bit + 7) // 8} bytes, at most 8 are supported)"
                 )
-                for s in sigs
-            ]
-
-            if ct_signals:
-                max_end_bit = max(s.start + s.length for s in ct_signals)
-                dlc = max(1, min(8, (max_end_bit + 7) // 8))
-            else:
-                dlc = 8
-
-            msg = Message(
-                frame_id=frame_id,
-                name=msg_name,
-                length=dlc,
-                signals=ct_signals,
-                is_extended_frame=(frame_id > 0x7FF),
-            )
-            db.messages.append(msg)
+            dlc = max(1, (max_end_bit + 7) // 8)
+
+            # Extended (29-bit) identifiers carry bit 31 in DBC files.
+            dbc_frame_id = frame_id | 0x80000000 if frame_id > 0x7FF else frame_id
+            lines_append(_BO_TMPL % (dbc_frame_id, msg_name, dlc))
+            for name, start, length, byte_order, is_signed, scale, offs, minimum, maximum, unit in zip(
+                columns["name"], columns["start"], columns["length"], columns["byte_order"],
+                columns["is_signed"], columns["scale"], columns["offset"], columns["minimum"],
+                columns["maximum"], columns["unit"],
+            ):
+                lines_append(_SG_TMPL % (
+                    name, start, length,
+                    0 if byte_order == "big_endian" else 1,
+                    "-" if is_signed else "+",
+                    scale, offs,
+                    0 if minimum is None else minimum,
+                    0 if maximum is None else maximum,
+                    "" if unit is None else unit,
+                ))
+            lines_append("\n")
 
         Path(output_dbc).parent.mkdir(parents=True, exist_ok=True)
-        with open(output_dbc, "w", encoding="utf-8") as f:
-            f.write(db.as_dbc_string())
+        with open(output_dbc, "w", encoding="utf-8", buffering=1 << 20) as f:
+            f.write("".join(lines))
 
         if not silent:
             messagebox.showinfo("Success", f"DBC created: {output_dbc}")
@@ -264,16 +636,25 @@ def run_batch_dbc_to_excel(base_name: str):
     failed = 0
     outputs = []
 
-    for fp in file_paths:
-        stem = Path(fp).stem
-        out = outdir / f"{base} CAN Matrix - {stem}.xlsx"
-        saved = process_dbc_file(str(fp), str(out), silent=True)
-        if saved:
-            successes += 1
-            outputs.append(saved)
-            print(f"[SAVED] {saved}")
-        else:
-            failed += 1
+    # Each conversion is independent and CPU-bound, so spread them across cores.
+    with ProcessPoolExecutor() as executor:
+        futures = {
+            executor.submit(process_dbc_file, str(fp), str(outdir / f"{base} CAN Matrix - {Path(fp).stem}.xlsx"), True): fp
+            for fp in file_paths
+        }
+        # Collect in submission order so the "Example" path is the first selected file.
+        for future, src in futures.items():
+            try:
+                saved = future.result()
+            except Exception as e:
+                print(f"[ERROR] {src} -> {e}")
+                saved = None
+            if saved:
+                successes += 1
+                outputs.append(saved)
+                print(f"[SAVED] {saved}")
+            else:
+                failed += 1
 
     msg = f"Batch complete.\nSaved: {successes}\nFailed: {failed}\nFolder: {outdir}"
     if outputs:
@@ -331,15 +712,23 @@ def run_batch_excel_to_dbc(base_name: str):
     failed = 0
     outputs = []
 
-    for xp in excel_paths:
-        stem = Path(xp).stem
-        out = outdir / f"{base} - {stem}.dbc"
-        saved = process_excel_to_dbc(str(xp), str(out), silent=True)
-        if saved:
-            successes += 1
-            outputs.append(saved)
-        else:
-            failed += 1
+    with ProcessPoolExecutor() as executor:
+        futures = {
+            executor.submit(process_excel_to_dbc, str(xp), str(outdir / f"{base} - {Path(xp).stem}.dbc"), True): xp
+            for xp in excel_paths
+        }
+        # Collect in submission order so the "Example" path is the first selected file.
+        for future, src in futures.items():
+            try:
+                saved = future.result()
+            except Exception as e:
+                print(f"[ERROR] {src} -> {e}")
+                saved = None
+            if saved:
+                successes += 1
+                outputs.append(saved)
+            else:
+                failed += 1
 
     msg = f"Batch complete.\nSaved: {successes}\nFailed: {failed}\nFolder: {outdir}"
     if outputs:
@@ -369,68 +758,84 @@ def run_single_excel_to_dbc():
     process_excel_to_dbc(excel_path, output_dbc, silent=False)
 
 # UI
-root = tk.Tk()
-root.title("DBC ↔ CAN Matrix Converter")
-root.geometry("840x380")
-
-# Set icon if available
-try:
-    icon_img = PhotoImage(file=relative_to_assets("KineticGreen.png"))
-    root.wm_iconphoto(True, icon_img)
-except Exception:
-    pass
-
-# Set AppUserModelID (Windows)
-if sys.platform == "win32":
+def _build_ui():
+    """
+    Create the converter window and run the Tk main loop.
+    Kept out of module scope so that importing this file (including from
+    batch worker processes, which re-import it on Windows) has no side effects.
+    """
+    # DPI awareness (Windows)
     try:
-        app_id = "KineticGreen.UDS"
-        windll.shell32.SetCurrentProcessExplicitAppUserModelID(app_id)
+        ctypes.windll.shcore.SetProcessDpiAwareness(1)
     except Exception:
         pass
 
-title_label = tk.Label(root, text="Convert between DBC and CAN Matrix (Excel)", font=("Segoe UI", 11, "bold"))
-title_label.pack(pady=10)
-
-controls = tk.Frame(root)
-controls.pack(pady=8)
-
-batch_var = tk.BooleanVar(value=False)
-batch_check = tk.Checkbutton(controls, text="Batch mode", variable=batch_var)
-batch_check.grid(row=0, column=0, padx=8, pady=4, sticky="w")
+    root = tk.Tk()
+    root.title("DBC ↔ CAN Matrix Converter")
+    root.geometry("840x380")
 
-tk.Label(controls, text="Base Name (used in batch):").grid(row=0, column=1, padx=8, pady=4, sticky="e")
-base_name_var = tk.StringVar(value="")
-base_name_entry = tk.Entry(controls, textvariable=base_name_var, width=34)
-base_name_entry.grid(row=0, column=2, padx=8, pady=4, sticky="w")
+    # Set icon if available
+    try:
+        icon_img = PhotoImage(file=relative_to_assets("KineticGreen.png"))
+        root.wm_iconphoto(True, icon_img)
+    except Exception:
+        pass
 
-btns = tk.Frame(root)
-btns.pack(pady=16)
+    # Set AppUserModelID (Windows)
+    if sys.platform == "win32":
+        try:
+            app_id = "KineticGreen.UDS"
+            ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(app_id)
+        except Exception:
+            pass
+
+    title_label = tk.Label(root, text="Convert between DBC and CAN Matrix (Excel)", font=("Segoe UI", 11, "bold"))
+    title_label.pack(pady=10)
+
+    controls = tk.Frame(root)
+    controls.pack(pady=8)
+
+    batch_var = tk.BooleanVar(value=False)
+    batch_check = tk.Checkbutton(controls, text="Batch mode", variable=batch_var)
+    batch_check.grid(row=0, column=0, padx=8, pady=4, sticky="w")
+
+    tk.Label(controls, text="Base Name (used in batch):").grid(row=0, column=1, padx=8, pady=4, sticky="e")
+    base_name_var = tk.StringVar(value="")
+    base_name_entry = tk.Entry(controls, textvariable=base_name_var, width=34)
+    base_name_entry.grid(row=0, column=2, padx=8, pady=4, sticky="w")
+
+    btns = tk.Frame(root)
+    btns.pack(pady=16)
+
+    dbc_to_excel_btn = tk.Button(
+        btns,
+        text="DBC → CAN Matrix (Excel)",
+        width=32,
+        command=lambda: run_batch_dbc_to_excel(base_name_var.get()) if batch_var.get() else run_single_dbc_to_excel()
+    )
+    dbc_to_excel_btn.grid(row=0, column=0, padx=10, pady=8)
 
-dbc_to_excel_btn = tk.Button(
-    btns,
-    text="DBC → CAN Matrix (Excel)",
-    width=32,
-    command=lambda: run_batch_dbc_to_excel(base_name_var.get()) if batch_var.get() else run_single_dbc_to_excel()
-)
-dbc_to_excel_btn.grid(row=0, column=0, padx=10, pady=8)
+    excel_to_dbc_btn = tk.Button(
+        btns,
+        text="CAN Matrix (Excel) → DBC",
+        width=32,
+        command=lambda: run_batch_excel_to_dbc(base_name_var.get()) if batch_var.get() else run_single_excel_to_dbc()
+    )
+    excel_to_dbc_btn.grid(row=0, column=1, padx=10, pady=8)
+
+    hint = tk.Label(
+        root,
+        text=(
+            "Batch naming:\n"
+            " - DBC → Excel: [Base Name] CAN Matrix - [OriginalName].xlsx\n"
+            " - Excel → DBC: [Base Name] - [OriginalName].dbc"
+        ),
+        justify="center"
+    )
+    hint.pack(pady=6)
 
-excel_to_dbc_btn = tk.Button(
-    btns,
-    text="CAN Matrix (Excel) → DBC",
-    width=32,
-    command=lambda: run_batch_excel_to_dbc(base_name_var.get()) if batch_var.get() else run_single_excel_to_dbc()
-)
-excel_to_dbc_btn.grid(row=0, column=1, padx=10, pady=8)
-
-hint = tk.Label(
-    root,
-    text=(
-        "Batch naming:\n"
-        " - DBC → Excel: [Base Name] CAN Matrix - [OriginalName].xlsx\n"
-        " - Excel → DBC: [Base Name] - [OriginalName].dbc"
-    ),
-    justify="center"
-)
-hint.pack(pady=6)
+    root.mainloop()
 
-root.mainloop()
\ No newline at end of file
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    _build_ui()